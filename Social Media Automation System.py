@@ -10,28 +10,50 @@ Efficient, secure toolkit for social media automation with async support
 
 import os
 
-import json
+import re
+
+import random
+
+import time
 
 import asyncio
 
 import logging
 
-from datetime import datetime, timedelta
+import functools
+
+from datetime import datetime, timedelta, timezone
 
 from dataclasses import dataclass
 
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 
 from pathlib import Path
 
 import aiosqlite
 
+import orjson
+
+from aiosqlitepool import SQLiteConnectionPool
+
 import tweepy
 
+from tweepy.asynchronous import AsyncClient
+
 import aiohttp
 
+from aiolimiter import AsyncLimiter
+
 from contextlib import asynccontextmanager
 
+try:
+
+    import uvloop  # Optional faster event loop; not available on Windows
+
+except ImportError:
+
+    uvloop = None
+
 # Logging setup
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -52,6 +74,44 @@ class Post:
 
     status: str = "pending"
 
+def _as_naive_utc(value: datetime) -> datetime:
+
+    """Convert aware datetimes to naive UTC, the frame scheduling comparisons use"""
+
+    if value.tzinfo is None:
+
+        return value
+
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+_TWITTER_ENV_VARS = (
+
+    ('api_key', 'TWITTER_API_KEY'),
+
+    ('api_secret', 'TWITTER_API_SECRET'),
+
+    ('access_token', 'TWITTER_ACCESS_TOKEN'),
+
+    ('access_token_secret', 'TWITTER_ACCESS_TOKEN_SECRET'),
+
+    ('bearer_token', 'TWITTER_BEARER_TOKEN')
+
+)
+
+@functools.lru_cache(maxsize=1)
+
+def _load_twitter_config() -> Tuple[str, ...]:
+
+    """Read and validate Twitter credentials once; call cache_clear() after changing the environment"""
+
+    values = tuple(os.getenv(env_var) for _, env_var in _TWITTER_ENV_VARS)
+
+    if not all(values):
+
+        raise ValueError("Missing Twitter API credentials")
+
+    return values
+
 class ConfigManager:
 
     """Environment-based configuration"""
@@ -62,37 +122,127 @@ class ConfigManager:
 
     def get_twitter_config() -> Dict[str, str]:
 
-        config = {
+        return dict(zip((key for key, _ in _TWITTER_ENV_VARS), _load_twitter_config()))
 
-            'api_key': os.getenv('TWITTER_API_KEY'),
+class Database:
 
-            'api_secret': os.getenv('TWITTER_API_SECRET'),
+    """Async SQLite manager backed by a pool of long-lived aiosqlite connections"""
+
+    
 
-            'access_token': os.getenv('TWITTER_ACCESS_TOKEN'),
+    def __init__(self, db_path: str = "automation.db", pool_size: int = 5,
 
-            'access_token_secret': os.getenv('TWITTER_ACCESS_TOKEN_SECRET'),
+                 batch_size: int = 64, flush_interval: float = 0.02):
 
-            'bearer_token': os.getenv('TWITTER_BEARER_TOKEN')
+        self.db_path = db_path
 
-        }
+        self.pool_size = pool_size
 
-        
+        self.batch_size = batch_size
 
-        if not all(config.values()):
+        self.flush_interval = flush_interval
 
-            raise ValueError("Missing Twitter API credentials")
+        self._pool: Optional[SQLiteConnectionPool] = None
 
-        return config
+        self._insert_queue: Optional[asyncio.Queue] = None
 
-class Database:
+        self._writer_task: Optional[asyncio.Task] = None
 
-    """Async SQLite manager using aiosqlite"""
+        self._closed = False
 
     
 
-    def __init__(self, db_path: str = "automation.db"):
+    async def _connect(self) -> aiosqlite.Connection:
 
-        self.db_path = db_path
+        """Open a pooled connection; pragmas are applied once per connection"""
+
+        # Autocommit mode (writes batch via _transaction) with a larger prepared-statement cache
+
+        conn = await aiosqlite.connect(self.db_path, cached_statements=256, isolation_level=None)
+
+        conn.row_factory = aiosqlite.Row
+
+        # These pragmas are per-connection; journal_mode=WAL persists in the file (see init_db)
+
+        await conn.executescript('''
+
+            PRAGMA synchronous=NORMAL;
+
+            PRAGMA wal_autocheckpoint=1000;
+
+            PRAGMA mmap_size=268435456;
+
+            PRAGMA cache_size=-64000;
+
+            PRAGMA temp_store=MEMORY;
+
+        ''')
+
+        return conn
+
+    
+
+    @property
+
+    def pool(self) -> SQLiteConnectionPool:
+
+        """Connection pool, created lazily inside the running event loop"""
+
+        if self._pool is None:
+
+            self._pool = SQLiteConnectionPool(self._connect, pool_size=self.pool_size)
+
+        return self._pool
+
+    
+
+    async def close(self):
+
+        """Flush queued inserts, stop the write-behind task and close all pooled connections"""
+
+        self._closed = True
+
+        if self._writer_task is not None:
+
+            await self._insert_queue.join()
+
+            self._writer_task.cancel()
+
+            await asyncio.gather(self._writer_task, return_exceptions=True)
+
+            self._writer_task = None
+
+            self._insert_queue = None
+
+        if self._pool is not None:
+
+            await self._pool.close()
+
+            self._pool = None
+
+    
+
+    @asynccontextmanager
+
+    async def _transaction(self):
+
+        """Pooled connection wrapped in an explicit BEGIN IMMEDIATE/COMMIT"""
+
+        async with self.pool.connection() as conn:
+
+            await conn.execute('BEGIN IMMEDIATE')
+
+            try:
+
+                yield conn
+
+            except BaseException:
+
+                await conn.execute('ROLLBACK')
+
+                raise
+
+            await conn.execute('COMMIT')
 
     
 
@@ -100,10 +250,14 @@ class Database:
 
         """Initialize database asynchronously"""
 
-        async with aiosqlite.connect(self.db_path) as conn:
+        async with self.pool.connection() as conn:
 
             await conn.executescript('''
 
+                PRAGMA journal_mode=WAL;
+
+                
+
                 CREATE TABLE IF NOT EXISTS posts (
 
                     id INTEGER PRIMARY KEY,
@@ -124,65 +278,201 @@ class Database:
 
                 
 
-                CREATE INDEX IF NOT EXISTS idx_posts_schedule 
+                DROP INDEX IF EXISTS idx_posts_schedule;
 
-                ON posts(scheduled_time, status);
+                
 
-            ''')
+                CREATE INDEX IF NOT EXISTS idx_posts_pending 
+
+                ON posts(scheduled_time) WHERE status = 'pending';
 
-            await conn.commit()
+            ''')
 
     
 
     async def save_post(self, post: Post) -> int:
 
-        async with aiosqlite.connect(self.db_path) as conn:
+        """Queue a post for the write-behind task and wait for its row id"""
 
-            cursor = await conn.execute(
+        if self._closed:
 
-                'INSERT INTO posts (content, platform, scheduled_time, media_paths, status) VALUES (?, ?, ?, ?, ?)',
+            raise RuntimeError("Database closed")
 
-                (post.content[:280], post.platform, post.scheduled_time, 
+        if self._writer_task is None:
 
-                 json.dumps(post.media_paths) if post.media_paths else None, post.status)
+            self._insert_queue = asyncio.Queue()
 
-            )
+            self._writer_task = asyncio.create_task(self._write_behind())
 
-            await conn.commit()
+        
 
-            return cursor.lastrowid
+        future = asyncio.get_running_loop().create_future()
+
+        await self._insert_queue.put((post, future))
+
+        return await future
 
     
 
-    async def get_pending_posts(self) -> List[Dict]:
+    async def _write_behind(self):
+
+        """Drain queued inserts, committing up to batch_size posts per transaction"""
+
+        loop = asyncio.get_running_loop()
+
+        batch = []
+
+        try:
+
+            while True:
+
+                batch = [await self._insert_queue.get()]
+
+                deadline = loop.time() + self.flush_interval
+
+                while len(batch) < self.batch_size:
+
+                    timeout = deadline - loop.time()
+
+                    if timeout <= 0:
+
+                        break
+
+                    try:
+
+                        batch.append(await asyncio.wait_for(self._insert_queue.get(), timeout))
+
+                    except asyncio.TimeoutError:
+
+                        break
+
+                
+
+                try:
+
+                    post_ids = await self.save_posts_bulk([post for post, _ in batch])
+
+                except Exception as e:
+
+                    for _, future in batch:
+
+                        if not future.done():
+
+                            future.set_exception(e)
+
+                else:
+
+                    for (_, future), post_id in zip(batch, post_ids):
+
+                        if not future.done():
+
+                            future.set_result(post_id)
+
+                for _ in batch:
+
+                    self._insert_queue.task_done()
+
+        except asyncio.CancelledError:
+
+            # Never leave save_post callers waiting on a writer that is gone
+
+            while not self._insert_queue.empty():
 
-        async with aiosqlite.connect(self.db_path) as conn:
+                batch.append(self._insert_queue.get_nowait())
 
-            conn.row_factory = aiosqlite.Row
+            for _, future in batch:
+
+                if not future.done():
+
+                    future.set_exception(RuntimeError("Database closed"))
+
+            raise
+
+    
+
+    async def save_posts_bulk(self, posts: List[Post]) -> List[int]:
+
+        """Insert posts in a single transaction (one commit) and return their row ids"""
+
+        async with self._transaction() as conn:
+
+            post_ids = []
+
+            for post in posts:
+
+                # Store naive UTC so the pending query, MIN(scheduled_time) and wake-ups share one frame
+
+                scheduled_time = _as_naive_utc(post.scheduled_time) if post.scheduled_time else None
+
+                cursor = await conn.execute(
+
+                    'INSERT INTO posts (content, platform, scheduled_time, media_paths, status) VALUES (?, ?, ?, ?, ?)',
+
+                    (post.content, post.platform, scheduled_time, 
+
+                     orjson.dumps(post.media_paths) if post.media_paths else None, post.status)
+
+                )
+
+                post_ids.append(cursor.lastrowid)
+
+        return post_ids
+
+    
+
+    async def get_pending_posts(self) -> List[aiosqlite.Row]:
+
+        async with self.pool.connection() as conn:
 
             cursor = await conn.execute('''
 
-                SELECT * FROM posts 
+                SELECT id, content, platform, media_paths FROM posts 
 
-                WHERE status = 'pending' AND scheduled_time <= datetime('now')
+                WHERE status = 'pending' AND scheduled_time <= ?
 
                 ORDER BY scheduled_time LIMIT 20
 
-            ''')
-
-            rows = await cursor.fetchall()
+            ''', (datetime.utcnow(),))
 
-            return [dict(row) for row in rows]
+            return await cursor.fetchall()
 
     
 
     async def update_status(self, post_id: int, status: str):
 
-        async with aiosqlite.connect(self.db_path) as conn:
+        async with self.pool.connection() as conn:
 
             await conn.execute('UPDATE posts SET status = ? WHERE id = ?', (status, post_id))
 
-            await conn.commit()
+    
+
+    async def update_statuses(self, updates: List[Tuple[int, str]]):
+
+        """Apply many (post_id, status) updates in a single transaction"""
+
+        async with self._transaction() as conn:
+
+            await conn.executemany(
+
+                'UPDATE posts SET status = ? WHERE id = ?',
+
+                [(status, post_id) for post_id, status in updates]
+
+            )
+
+    
+
+    async def next_due(self) -> Optional[datetime]:
+
+        """Earliest scheduled_time among pending posts, or None if nothing is pending"""
+
+        async with self.pool.connection() as conn:
+
+            cursor = await conn.execute("SELECT MIN(scheduled_time) FROM posts WHERE status = 'pending'")
+
+            row = await cursor.fetchone()
+
+            return _as_naive_utc(datetime.fromisoformat(row[0])) if row[0] else None
 
 class TwitterBot:
 
@@ -190,19 +480,33 @@ class TwitterBot:
 
     
 
-    def __init__(self, config: Dict[str, str]):
+    def __init__(self, config: Dict[str, str], max_rate: float = 300, time_period: float = 15 * 60,
+
+                 max_concurrency: int = 5):
 
         self.config = config
 
+        # AsyncLimiter's burst equals its rate, so a bucket of 1 spaces requests evenly:
+
+        # one per time_period / max_rate seconds. Keep max_rate per time_period below
+
+        # Twitter's create-tweet limit for your access tier, or posts will hit 429s.
+
+        self._limiter = AsyncLimiter(1, time_period / max_rate)
+
+        self._sem = asyncio.Semaphore(max_concurrency)
+
         self._setup_clients()
 
     
 
     def _setup_clients(self):
 
+        """Create the client; must be called while the event loop is running"""
+
         try:
 
-            self.client = tweepy.Client(
+            self.client = AsyncClient(
 
                 bearer_token=self.config['bearer_token'],
 
@@ -214,13 +518,21 @@ class TwitterBot:
 
                 access_token_secret=self.config['access_token_secret'],
 
-                wait_on_rate_limit=True
+                # Pacing is done by the limiter; a 429 falls through to post_tweet's backoff
+
+                wait_on_rate_limit=False
 
             )
 
             
 
-            # Test authentication in thread to avoid blocking event loop
+            # Share one keep-alive session so TLS connections are reused across tweets
+
+            self.client.session = aiohttp.ClientSession(
+
+                connector=aiohttp.TCPConnector(limit=20, keepalive_timeout=75)
+
+            )
 
             logger.info("Twitter client initialized")
 
@@ -234,23 +546,45 @@ class TwitterBot:
 
     
 
-    async def post_tweet(self, content: str, media_paths: List[str] = None, retries: int = 2) -> Optional[str]:
+    async def close(self):
 
-        """Post tweet with async retry logic using thread executor"""
+        """Close the shared HTTP session"""
 
-        for attempt in range(retries + 1):
+        await self.client.session.close()
 
-            try:
+    
 
-                # Run blocking tweepy call in thread to avoid blocking event loop
+    @staticmethod
 
-                response = await asyncio.to_thread(
+    def _rate_limit_wait(error: tweepy.TooManyRequests, attempt: int) -> float:
 
-                    self.client.create_tweet,
+        """Seconds until the window resets per x-rate-limit-reset, else jittered exponential backoff"""
 
-                    text=content[:280]
+        # tweepy parses the header into reset_time (None when absent) before raising
 
-                )
+        if error.reset_time:
+
+            # Cap at one 15-minute window; the small jitter spreads concurrent wake-ups
+
+            return min(max(1, error.reset_time - time.time()), 900) + random.uniform(0, 1)
+
+        # Full jitter so concurrent posts don't all retry at the same instant
+
+        return random.uniform(0, 60 * (2 ** attempt))
+
+    
+
+    async def post_tweet(self, content: str, media_paths: List[str] = None, retries: int = 2) -> Optional[str]:
+
+        """Post tweet with async retry logic over the shared HTTP session"""
+
+        for attempt in range(retries + 1):
+
+            try:
+
+                async with self._sem, self._limiter:
+
+                    response = await self.client.create_tweet(text=content)
 
                 tweet_id = response.data['id']
 
@@ -260,13 +594,13 @@ class TwitterBot:
 
                 
 
-            except tweepy.TooManyRequests:
+            except tweepy.TooManyRequests as e:
 
                 if attempt < retries:
 
-                    wait_time = 60 * (2 ** attempt)
+                    wait_time = self._rate_limit_wait(e, attempt)
 
-                    logger.warning(f"Rate limited, waiting {wait_time}s")
+                    logger.warning(f"Rate limited, waiting {wait_time:.1f}s")
 
                     await asyncio.sleep(wait_time)
 
@@ -284,7 +618,7 @@ class TwitterBot:
 
                 if attempt < retries:
 
-                    await asyncio.sleep(30)
+                    await asyncio.sleep(random.uniform(0, 30 * (2 ** attempt)))
 
                 else:
 
@@ -294,55 +628,55 @@ class TwitterBot:
 
         return None
 
-class ContentOptimizer:
+# Hashtag suggestions, in priority order; matched case-insensitively in one regex pass
 
-    """Content optimization utilities"""
+_HASHTAG_KEYWORDS = {
 
-    
+    'ai': '#AI', 'python': '#Python', 'tech': '#Tech',
 
-    @staticmethod
+    'automation': '#Automation', 'productivity': '#Productivity'
 
-    def optimize_for_twitter(content: str) -> str:
+}
 
-        """Optimize content for Twitter"""
+_HASHTAG_PATTERN = re.compile('|'.join(map(re.escape, _HASHTAG_KEYWORDS)), re.IGNORECASE)
 
-        # Add basic hashtag suggestions
+@functools.lru_cache(maxsize=2048)
 
-        hashtag_keywords = {
+def _optimize_for_twitter(content: str) -> str:
 
-            'ai': '#AI', 'python': '#Python', 'tech': '#Tech',
+    """Pure hashtag/length optimization, memoized since templated posts repeat"""
 
-            'automation': '#Automation', 'productivity': '#Productivity'
+    found = {match.group().lower() for match in _HASHTAG_PATTERN.finditer(content)}
 
-        }
+    hashtags = [tag for keyword, tag in _HASHTAG_KEYWORDS.items() if keyword in found][:2]
 
-        
+    
 
-        content_lower = content.lower()
+    if hashtags:
 
-        hashtags = []
+        hashtag_str = ' ' + ' '.join(hashtags)
 
-        
+        if len(content) + len(hashtag_str) <= 280:
 
-        for keyword, tag in hashtag_keywords.items():
+            content += hashtag_str
 
-            if keyword in content_lower and len(hashtags) < 2:
+    
 
-                hashtags.append(tag)
+    return content[:280]
 
-        
+class ContentOptimizer:
 
-        if hashtags:
+    """Content optimization utilities"""
 
-            hashtag_str = ' ' + ' '.join(hashtags)
+    
 
-            if len(content) + len(hashtag_str) <= 280:
+    @staticmethod
 
-                content += hashtag_str
+    def optimize_for_twitter(content: str) -> str:
 
-        
+        """Optimize content for Twitter"""
 
-        return content[:280]
+        return _optimize_for_twitter(content)
 
 class AutomationEngine:
 
@@ -358,6 +692,14 @@ class AutomationEngine:
 
         self.twitter = None
 
+        self._auth_check: Optional[asyncio.Task] = None
+
+        # Lets schedule_post wake run_scheduler when a post is due before its planned wake-up
+
+        self._schedule_changed = asyncio.Event()
+
+        self._next_wakeup: Optional[datetime] = None
+
     
 
     async def initialize(self):
@@ -376,11 +718,11 @@ class AutomationEngine:
 
             
 
-            # Test authentication in thread
+            # Test authentication in the background; publishing surfaces auth errors anyway
 
-            await asyncio.to_thread(self.twitter.client.get_me)
+            self._auth_check = asyncio.create_task(self.twitter.client.get_me())
 
-            logger.info("Twitter authentication successful")
+            self._auth_check.add_done_callback(self._log_auth_result)
 
             
 
@@ -394,19 +736,59 @@ class AutomationEngine:
 
     
 
-    async def schedule_post(self, content: str, platform: str, 
+    @staticmethod
 
-                          scheduled_time: datetime, media_paths: List[str] = None) -> int:
+    def _log_auth_result(task: asyncio.Task):
 
-        """Schedule a post for later publication"""
+        """Report the outcome of the background authentication check"""
+
+        if task.cancelled():
+
+            return
+
+        if task.exception():
+
+            logger.error(f"Twitter authentication failed: {task.exception()}")
+
+        else:
+
+            logger.info("Twitter authentication successful")
+
+    
+
+    async def close(self):
+
+        """Release async resources"""
+
+        if self._auth_check and not self._auth_check.done():
+
+            self._auth_check.cancel()
+
+        if self.twitter:
+
+            await self.twitter.close()
+
+        await self.db.close()
+
+    
+
+    def _prepare_post(self, content: str, platform: str, 
+
+                      scheduled_time: datetime, media_paths: List[str] = None) -> Post:
+
+        """Optimize and truncate content into a Post ready for storage"""
 
         if platform == 'twitter':
 
-            content = self.optimizer.optimize_for_twitter(content)
+            content = self.optimizer.optimize_for_twitter(content)  # Already bounded to 280 chars
+
+        else:
+
+            content = content[:280]
 
         
 
-        post = Post(
+        return Post(
 
             content=content,
 
@@ -418,16 +800,80 @@ class AutomationEngine:
 
         )
 
+    
+
+    def _wake_scheduler(self, scheduled_time: Optional[datetime]):
+
+        """Wake run_scheduler if a new post is due before its planned wake-up"""
+
+        if scheduled_time is None:
+
+            return
+
+        if self._next_wakeup is None or _as_naive_utc(scheduled_time) < self._next_wakeup:
+
+            self._schedule_changed.set()
+
+    
+
+    async def schedule_post(self, content: str, platform: str, 
+
+                          scheduled_time: datetime, media_paths: List[str] = None) -> int:
+
+        """Schedule a post for later publication"""
+
+        post = self._prepare_post(content, platform, scheduled_time, media_paths)
+
         
 
         post_id = await self.db.save_post(post)
 
         logger.info(f"Post {post_id} scheduled for {platform} at {scheduled_time}")
 
+        self._wake_scheduler(scheduled_time)
+
         return post_id
 
     
 
+    async def schedule_posts(self, posts: List[Post]) -> List[int]:
+
+        """Schedule many posts with a single database commit"""
+
+        if not posts:
+
+            return []
+
+        
+
+        prepared = [
+
+            self._prepare_post(post.content, post.platform, post.scheduled_time, post.media_paths)
+
+            for post in posts
+
+        ]
+
+        # Computed before the insert so bad input can't fail a batch that is already stored
+
+        earliest = min(
+
+            (_as_naive_utc(post.scheduled_time) for post in prepared if post.scheduled_time),
+
+            default=None
+
+        )
+
+        post_ids = await self.db.save_posts_bulk(prepared)
+
+        logger.info(f"{len(post_ids)} posts scheduled")
+
+        self._wake_scheduler(earliest)
+
+        return post_ids
+
+    
+
     async def publish_now(self, content: str, platforms: List[str], 
 
                          media_paths: List[str] = None) -> Dict[str, Optional[str]]:
@@ -470,7 +916,7 @@ class AutomationEngine:
 
     async def process_scheduled_posts(self):
 
-        """Process pending scheduled posts"""
+        """Process pending scheduled posts, recording every outcome in one batched update"""
 
         pending_posts = await self.db.get_pending_posts()
 
@@ -488,51 +934,59 @@ class AutomationEngine:
 
         if tasks:
 
-            await asyncio.gather(*tasks, return_exceptions=True)
+            results = await asyncio.gather(*tasks, return_exceptions=True)
 
-    
+            updates = []
 
-    async def _process_single_post(self, post_data: Dict):
+            for post_data, result in zip(pending_posts, results):
 
-        """Process a single scheduled post"""
+                if isinstance(result, BaseException):
 
-        try:
+                    logger.error(f"Failed to process post {post_data['id']}: {result}")
 
-            media_paths = json.loads(post_data['media_paths']) if post_data['media_paths'] else None
+                    updates.append((post_data['id'], 'failed'))
 
-            
+                else:
 
-            results = await self.publish_now(
+                    updates.append(result)
 
-                post_data['content'],
+            await self.db.update_statuses(updates)
 
-                [post_data['platform']],
+    
 
-                media_paths
+    async def _process_single_post(self, post_data: aiosqlite.Row) -> Tuple[int, str]:
 
-            )
+        """Publish a single scheduled post and return its (post_id, status); errors propagate"""
 
-            
+        media_paths = orjson.loads(post_data['media_paths']) if post_data['media_paths'] else None
 
-            status = 'posted' if results.get(post_data['platform']) else 'failed'
+        
 
-            await self.db.update_status(post_data['id'], status)
+        results = await self.publish_now(
 
-            
+            post_data['content'],
 
-        except Exception as e:
+            [post_data['platform']],
 
-            logger.error(f"Failed to process post {post_data['id']}: {e}")
+            media_paths
 
-            await self.db.update_status(post_data['id'], 'failed')
+        )
+
+        
+
+        status = 'posted' if results.get(post_data['platform']) else 'failed'
+
+        return post_data['id'], status
 
     
 
     async def run_scheduler(self, interval_minutes: int = 5):
 
-        """Run the scheduler continuously"""
+        """Run the scheduler continuously, sleeping until the next post is due"""
+
+        logger.info(f"Scheduler started - idle checks every {interval_minutes} minutes")
 
-        logger.info(f"Scheduler started - checking every {interval_minutes} minutes")
+        max_sleep = interval_minutes * 60
 
         
 
@@ -540,9 +994,41 @@ class AutomationEngine:
 
             try:
 
+                # Until the next wake-up is known, any newly scheduled post wakes the loop
+
+                self._schedule_changed.clear()
+
+                self._next_wakeup = None
+
                 await self.process_scheduled_posts()
 
-                await asyncio.sleep(interval_minutes * 60)
+                
+
+                # Stored times are compared against UTC, as in get_pending_posts
+
+                next_due = await self.db.next_due()
+
+                now = datetime.utcnow()
+
+                sleep_for = max_sleep
+
+                if next_due is not None:
+
+                    # Floor of 1s: a due row the pending query can't see must not become a busy loop
+
+                    sleep_for = min(max(1, (next_due - now).total_seconds()), max_sleep)
+
+                self._next_wakeup = now + timedelta(seconds=sleep_for)
+
+                
+
+                try:
+
+                    await asyncio.wait_for(self._schedule_changed.wait(), timeout=sleep_for)
+
+                except asyncio.TimeoutError:
+
+                    pass
 
             except KeyboardInterrupt:
 
@@ -560,6 +1046,14 @@ async def main():
 
     """Main async function"""
 
+    # Run short-lived tasks (gather fan-out, cache hits) inline until they first suspend (Python 3.12+)
+
+    if hasattr(asyncio, 'eager_task_factory'):
+
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
+    
+
     # Check environment variables
 
     required_vars = ['TWITTER_API_KEY', 'TWITTER_API_SECRET', 
@@ -580,9 +1074,9 @@ async def main():
 
     
 
-    try:
+    engine = AutomationEngine()
 
-        engine = AutomationEngine()
+    try:
 
         await engine.initialize()  # Proper async initialization
 
@@ -608,19 +1102,25 @@ async def main():
 
         base_time = datetime.now() + timedelta(minutes=5)
 
-        for i, content in enumerate([
+        posts = [
+
+            Post(content=content, platform='twitter', scheduled_time=base_time + timedelta(minutes=i * 10))
+
+            for i, content in enumerate([
+
+                "💡 Proper async/await with aiosqlite and aiohttp!",
 
-            "💡 Proper async/await with aiosqlite and asyncio.to_thread!",
+                "📊 Event loop stays responsive during all I/O operations"
 
-            "📊 Event loop stays responsive during all I/O operations"
+            ])
 
-        ]):
+        ]
 
-            scheduled_time = base_time + timedelta(minutes=i * 10)
+        post_ids = await engine.schedule_posts(posts)
 
-            post_id = await engine.schedule_post(content, 'twitter', scheduled_time)
+        for post_id, post in zip(post_ids, posts):
 
-            print(f"Scheduled post {post_id} for {scheduled_time}")
+            print(f"Scheduled post {post_id} for {post.scheduled_time}")
 
         
 
@@ -634,6 +1134,16 @@ async def main():
 
         logger.error(f"Application error: {e}")
 
+    finally:
+
+        await engine.close()
+
 if __name__ == "__main__":
 
-    asyncio.run(main())
\ No newline at end of file
+    if uvloop is not None:
+
+        uvloop.run(main())
+
+    else:
+
+        asyncio.run(main())
\ No newline at end of file